@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark: boundary-correct streaming counter vs. the old fixed 8KB splitting.
+
+Usage:
+    python benchmarks/bench_streaming.py [--size-mb 32] [--encoding cl100k_base]
+"""
+
+import argparse
+import random
+import time
+
+import tiktoken
+
+from token_counter.counter import count_tokens_in_chunks
+
+WORDS = ["the", "token", "counter", "streams", "text", "über", "naïve", "数据", "🙂", "return", "x=1;", "\n", "\n\n    "]
+
+def make_corpus(size_mb: float, seed: int = 0) -> str:
+    """Generates a reproducible mixed prose/code/unicode corpus of roughly size_mb megabytes."""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    parts = []
+    length = 0
+    while length < target:
+        word = rng.choice(WORDS)
+        parts.append(word + " ")
+        length += len(word) + 1
+    return "".join(parts)
+
+def legacy_count(text: str, encoding: tiktoken.Encoding, chunk_size: int = 8192) -> int:
+    """The previous implementation: every 8KB chunk is encoded independently."""
+    return sum(len(encoding.encode_ordinary(text[i:i + chunk_size])) for i in range(0, len(text), chunk_size))
+
+def streaming_count(text: str, encoding: tiktoken.Encoding, chunk_size: int) -> int:
+    chunks = (text[i:i + chunk_size] for i in range(0, len(text), chunk_size))
+    return count_tokens_in_chunks(chunks, encoding, max_carry=8 * chunk_size)
+
+def measure(label: str, func, text: str, repeat: int) -> int:
+    best = float("inf")
+    tokens = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        tokens = func()
+        best = min(best, time.perf_counter() - start)
+    mb = len(text.encode("utf-8")) / (1024 * 1024)
+    print(f"{label:<28} {tokens:>12,} tokens  {best:8.3f}s  {mb / best:8.1f} MB/s  {tokens / best:12,.0f} tokens/s")
+    return tokens
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=32)
+    parser.add_argument("--encoding", default="cl100k_base")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    encoding = tiktoken.get_encoding(args.encoding)
+    text = make_corpus(args.size_mb)
+    exact = measure("whole text", lambda: len(encoding.encode_ordinary(text)), text, args.repeat)
+    legacy = measure("legacy 8KB chunks", lambda: legacy_count(text, encoding), text, args.repeat)
+    for chunk_size in (8192, 64 * 1024, 1024 * 1024, 8 * 1024 * 1024):
+        streamed = measure(f"streaming {chunk_size // 1024}K chunks", lambda: streaming_count(text, encoding, chunk_size), text, args.repeat)
+        assert streamed == exact, f"streaming count {streamed} != exact count {exact}"
+    print(f"\nlegacy over-count: {legacy - exact:+,} tokens")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+"""
+Persistent on-disk cache of per-file token counts.
+
+Entries are keyed by the absolute file path and encoding, and are only reused
+when the file's size, mtime and inode still match and the counter version is
+unchanged, so a warm run costs one stat() and one indexed lookup per file.
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from token_counter.counter import COUNTER_VERSION
+
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024  # 64MB
+CACHE_FILE_NAME = "token_counts.sqlite3"
+
+# Files modified this recently may still be changing within the same mtime tick,
+# so their counts are not stored.
+_RACY_WINDOW_SECONDS = 2.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS token_counts (
+    path TEXT NOT NULL,
+    encoding TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    version INTEGER NOT NULL,
+    tokens INTEGER NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (path, encoding)
+);
+CREATE INDEX IF NOT EXISTS token_counts_last_used ON token_counts (last_used);
+"""
+
+FileSignature = Tuple[int, int, int]  # (size, mtime_ns, inode)
+
+def default_cache_dir() -> Path:
+    """Returns the per-user cache directory, honouring XDG_CACHE_HOME."""
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "token-counter"
+
+def file_signature(file_path: str) -> Optional[FileSignature]:
+    """Returns the stat fields a cached count is validated against, or None if the file is gone."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+class TokenCountCache:
+    """SQLite-backed token count cache with size-based LRU eviction."""
+
+    def __init__(self, cache_dir: Optional[str] = None, max_size: int = DEFAULT_MAX_SIZE):
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._now = time.time()
+        self._signatures: Dict[Tuple[str, str], FileSignature] = {}
+        self._used: List[Tuple[str, str]] = []
+        self._conn = sqlite3.connect(str(self.cache_dir / CACHE_FILE_NAME), timeout=30)
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self) -> "TokenCountCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get(self, file_path: str, encoding_name: str) -> Optional[int]:
+        """Returns the cached token count for an unchanged file, or None on a miss."""
+        key = (os.path.abspath(file_path), encoding_name)
+        signature = file_signature(file_path)
+        if signature is None:
+            self.misses += 1
+            return None
+        self._signatures[key] = signature
+        row = self._conn.execute(
+            "SELECT size, mtime_ns, inode, version, tokens FROM token_counts WHERE path = ? AND encoding = ?",
+            key,
+        ).fetchone()
+        if row is None or tuple(row[:3]) != signature or row[3] != COUNTER_VERSION:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._used.append(key)
+        return row[4]
+
+    def put(self, file_path: str, encoding_name: str, token_count: int) -> None:
+        """Stores a freshly computed count, using the file state seen by the preceding get()."""
+        key = (os.path.abspath(file_path), encoding_name)
+        signature = self._signatures.pop(key, None) or file_signature(file_path)
+        if signature is None or token_count < 0:
+            return
+        if self._now - signature[1] / 1e9 < _RACY_WINDOW_SECONDS:
+            return
+        self._conn.execute(
+            "INSERT OR REPLACE INTO token_counts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (*key, *signature, COUNTER_VERSION, token_count, self._now),
+        )
+
+    def size(self) -> int:
+        """Returns the number of bytes used by live cache pages."""
+        page_size = self._conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = self._conn.execute("PRAGMA page_count").fetchone()[0]
+        free_pages = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+        return (page_count - free_pages) * page_size
+
+    def evict(self) -> int:
+        """Drops least recently used entries until the cache fits max_size. Returns the number removed."""
+        removed = 0
+        current_size = self.size()
+        while current_size > self.max_size:
+            rows = self._conn.execute("SELECT COUNT(*) FROM token_counts").fetchone()[0]
+            if not rows:
+                break
+            # Aim for 90% of the limit, so eviction doesn't run again on the next call.
+            bytes_per_row = current_size / rows
+            to_remove = min(rows, int((current_size - self.max_size * 0.9) / bytes_per_row) + 1)
+            self._conn.execute(
+                "DELETE FROM token_counts WHERE rowid IN (SELECT rowid FROM token_counts ORDER BY last_used LIMIT ?)",
+                (to_remove,),
+            )
+            removed += to_remove
+            current_size = self.size()
+        return removed
+
+    def close(self) -> None:
+        """Refreshes LRU timestamps of hits, evicts if needed and commits."""
+        if self._conn is None:
+            return
+        self._conn.executemany(
+            "UPDATE token_counts SET last_used = ? WHERE path = ? AND encoding = ?",
+            ((self._now, *key) for key in self._used),
+        )
+        self.evict()
+        self._conn.commit()
+        self._conn.close()
+        self._conn = None
@@ -2,16 +2,17 @@ import typer
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn
-from InquirerPy import inquirer
-from InquirerPy.validator import EmptyInputValidator
 from typing import Optional, List
 import sys
 import os
 from pathlib import Path
 import fnmatch
 import json
+import sqlite3
 
-from token_counter.counter import count_tokens
+from token_counter.cache import DEFAULT_MAX_SIZE, TokenCountCache
+from token_counter.counter import DEFAULT_CHUNK_SIZE, count_tokens
+from token_counter.parallel import EXECUTOR_TYPES, count_files_parallel, resolve_jobs
 
 app = typer.Typer()
 console = Console()
@@ -54,6 +55,20 @@ def is_excluded(path: str, exclude_patterns: List[str]) -> bool:
             return True
     return False
 
+def report_file_result(file_path: str, token_count: int, encoding_name: str, results_table: Table) -> bool:
+    """Prints the error for a failed file or adds its row to the results table. Returns True on success."""
+    if token_count == -1:
+        console.print(f"[bold red]Error:[/] File not found at [cyan]{file_path}[/cyan]", style="bold")
+    elif token_count == -3:
+        console.print(f"[bold red]Error:[/] Invalid encoding name: [cyan]{encoding_name}[/cyan] for file [cyan]{file_path}[/cyan]", style="bold")
+    elif token_count == -2:
+        console.print(f"[bold red]Error:[/] An error occurred while processing [cyan]{file_path}[/cyan].", style="bold")
+    else:
+        results_table.add_row(file_path, format_number_with_separators(token_count), encoding_name)
+        return True
+    # Continue to next file, don't exit
+    return False
+
 def format_number_with_separators(num: int) -> str:
     """Format number with thousand separators (commas)."""
     return f"{num:,}"
@@ -185,13 +200,54 @@ def main(
         "--recursive",
         "-r",
         help="Recursively scan subdirectories when processing directories."
+    ),
+    jobs: int = typer.Option(
+        1,
+        "--jobs",
+        "-j",
+        help="Number of files to count in parallel. Use 0 to start one worker per CPU."
+    ),
+    executor: str = typer.Option(
+        "process",
+        "--executor",
+        help="Worker pool used with --jobs: 'process' (default) or 'thread'."
+    ),
+    chunk_size: int = typer.Option(
+        DEFAULT_CHUNK_SIZE,
+        "--chunk-size",
+        min=1,
+        help="Number of bytes read from a file per chunk. Larger chunks use more memory but fewer encode calls."
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Do not read or update the persistent token count cache."
+    ),
+    cache_dir: Optional[str] = typer.Option(
+        None,
+        "--cache-dir",
+        help="Directory for the token count cache (default: $XDG_CACHE_HOME/token-counter or ~/.cache/token-counter)."
+    ),
+    cache_max_size: int = typer.Option(
+        DEFAULT_MAX_SIZE // (1024 * 1024),
+        "--cache-max-size",
+        min=1,
+        help="Maximum cache size in MB. Least recently used entries are evicted beyond it."
     )
 ):
     """Counts the tokens in text files or stdin and displays the result."""
 
     selected_encoding = "cl100k_base" # Default encoding
 
+    if executor not in EXECUTOR_TYPES:
+        console.print(f"[bold red]Error:[/] Invalid executor [cyan]{executor}[/cyan]. Choose one of: {', '.join(EXECUTOR_TYPES)}.", style="bold")
+        raise typer.Exit(code=1)
+
     if select_encoding:
+        # InquirerPy is slow to import and only needed for the interactive menu
+        from InquirerPy import inquirer
+        from InquirerPy.validator import EmptyInputValidator
+
         encoding_choices = [
             {"name": f"{name} - {desc}", "value": name}
             for name, desc in ENCODING_OPTIONS.items()
@@ -348,6 +404,23 @@ def main(
     results_table.add_column("Token Count", justify="right", style="magenta")
     results_table.add_column("Encoding", justify="left", style="green")
 
+    file_counts = [0] * len(files_to_process)
+    pending_indexes = list(range(len(files_to_process)))
+    cache = None
+    if not no_cache:
+        try:
+            cache = TokenCountCache(cache_dir, max_size=cache_max_size * 1024 * 1024)
+        except (OSError, sqlite3.Error) as e:
+            console.print(f"[bold yellow]Warning:[/] Token count cache unavailable ({e}). Counting without cache.")
+    if cache:
+        pending_indexes = []
+        for index, file_path in enumerate(files_to_process):
+            cached_count = cache.get(file_path, selected_encoding)
+            if cached_count is None:
+                pending_indexes.append(index)
+            else:
+                file_counts[index] = cached_count
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -355,34 +428,45 @@ def main(
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
         console=console
     ) as progress:
-        for file_path in files_to_process:
-            task = progress.add_task(f"[cyan]Processing {file_path}[/cyan]", total=None)
-            token_count = count_tokens(file_path=file_path, progress=progress, task_id=task, encoding_name=selected_encoding)
-
-            if token_count == -1:
-                console.print(f"[bold red]Error:[/] File not found at [cyan]{file_path}[/cyan]", style="bold")
-                # Continue to next file, don't exit
-            elif token_count == -3:
-                console.print(f"[bold red]Error:[/] Invalid encoding name: [cyan]{selected_encoding}[/cyan] for file [cyan]{file_path}[/cyan]", style="bold")
-                # Continue to next file, don't exit
-            elif token_count == -2:
-                console.print(f"[bold red]Error:[/] An error occurred while processing [cyan]{file_path}[/cyan].", style="bold")
-                # Continue to next file, don't exit
-            else:
-                results_table.add_row(file_path, format_number_with_separators(token_count), selected_encoding)
-                total_tokens_overall += token_count
+        workers = min(resolve_jobs(jobs), len(pending_indexes))
+        if workers <= 1:
+            for index in pending_indexes:
+                file_path = files_to_process[index]
+                task = progress.add_task(f"[cyan]Processing {file_path}[/cyan]", total=None)
+                file_counts[index] = count_tokens(file_path=file_path, progress=progress, task_id=task, encoding_name=selected_encoding, chunk_size=chunk_size)
+        else:
+            pending_paths = [files_to_process[index] for index in pending_indexes]
+            task = progress.add_task(f"[cyan]Processing {len(pending_paths)} files with {workers} {executor} workers[/cyan]", total=len(pending_paths))
+            for pending_index, file_path, token_count in count_files_parallel(pending_paths, selected_encoding, workers, executor, chunk_size):
+                file_counts[pending_indexes[pending_index]] = token_count
+                progress.update(task, advance=1)
+
+    # Report in input order so the output doesn't depend on worker scheduling
+    counted_files = 0
+    for file_path, token_count in zip(files_to_process, file_counts):
+        if report_file_result(file_path, token_count, selected_encoding, results_table):
+            total_tokens_overall += token_count
+            counted_files += 1
+
+    if cache:
+        for index in pending_indexes:
+            cache.put(files_to_process[index], selected_encoding, file_counts[index])
+        cache.close()
 
     console.print(results_table)
     if len(files_to_process) > 1:
         console.print(f"\n[bold green]Total Tokens Across All Files:[/bold green] [bold magenta]{format_number_with_separators(total_tokens_overall)}[/bold magenta]")
+    if cache:
+        lookups = cache.hits + cache.misses
+        hit_rate = (cache.hits / lookups) * 100 if lookups else 0.0
+        console.print(f"[dim]Cache: {format_number_with_separators(cache.hits)} hits, {format_number_with_separators(cache.misses)} misses ({hit_rate:.1f}% hit rate)[/dim]")
 
     if check_limits and LLM_LIMITS:
         console.print("\n[bold yellow]LLM Context Window Limits:[/bold yellow]")
-        tokens_to_check = total_tokens_overall if len(files_to_process) > 1 else (token_count if 'token_count' in locals() else 0)
-        
-        if tokens_to_check == 0 and len(files_to_process) == 1 and 'token_count' not in locals():
-            # This case handles when a single file was processed but resulted in an error
-            pass # No limits to check if there was an error and no tokens counted
+        tokens_to_check = total_tokens_overall
+
+        if counted_files == 0:
+            pass # No limits to check if every file resulted in an error
         else:
             grouped_models = group_models_by_provider(LLM_LIMITS)
             
@@ -1,41 +1,195 @@
-import tiktoken
+import codecs
+import mmap
 import os
-from rich.progress import Progress
-from typing import Optional
+import re
+import stat
+import threading
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, Optional
+
+if TYPE_CHECKING:
+    # Only needed for annotations; tiktoken and rich are imported on first use
+    # so that importing this module stays cheap.
+    import tiktoken
+    from rich.progress import Progress
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1MB per read
+
+# Bump whenever the count for the same input and encoding can change, so that
+# persisted counts from older versions are not reused.
+COUNTER_VERSION = 3
+
+# A non-whitespace character followed by ASCII whitespace is a piece boundary for
+# every tiktoken pre-tokenizer pattern: no piece runs from a word, number or
+# punctuation run into the whitespace after it. Cutting there keeps the
+# streamed count identical to encoding the whole text at once.
+_SAFE_SPLIT = re.compile(r"\S(?=[ \t\r\n])")
+_SPLIT_SEARCH_WINDOW = 4096
+
+# How far the carried-over tail may grow (as a multiple of the chunk size) when
+# no safe boundary shows up, e.g. in minified files without whitespace.
+MAX_CARRY_FACTOR = 8
+
+# Loaded encodings by name. tiktoken keeps its own cache as well, but going
+# through this registry avoids importing tiktoken at all until a count is needed.
+_ENCODINGS: Dict[str, "tiktoken.Encoding"] = {}
+_ENCODINGS_LOCK = threading.Lock()
+
+def get_encoding(encoding_name: str) -> "tiktoken.Encoding":
+    """Returns the named tiktoken encoding, loading it on first use. Raises ValueError for unknown names."""
+    encoding = _ENCODINGS.get(encoding_name)
+    if encoding is None:
+        with _ENCODINGS_LOCK:
+            encoding = _ENCODINGS.get(encoding_name)
+            if encoding is None:
+                import tiktoken
+                encoding = tiktoken.get_encoding(encoding_name)
+                _ENCODINGS[encoding_name] = encoding
+    return encoding
+
+def warm_up(encoding_names: Iterable[str]) -> None:
+    """Loads encodings ahead of time, e.g. in a worker initializer or a long-running service."""
+    for encoding_name in encoding_names:
+        get_encoding(encoding_name)
+
+def find_safe_split(text: str) -> int:
+    """Returns the last index at which text can be cut without changing its token count, or -1."""
+    window = _SPLIT_SEARCH_WINDOW
+    while True:
+        start = max(len(text) - window, 0)
+        last_match = None
+        for last_match in _SAFE_SPLIT.finditer(text, start):
+            pass
+        if last_match is not None:
+            return last_match.end()
+        if start == 0:
+            return -1
+        window *= 4
+
+def count_tokens_in_chunks(
+    chunks: Iterable[str],
+    encoding: "tiktoken.Encoding",
+    max_carry: int = MAX_CARRY_FACTOR * DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    Counts tokens across a stream of text chunks as if they were one string.
+
+    The text after the last safe boundary of each chunk is carried over into the
+    next one, so tokens straddling chunk edges are counted exactly once. Only a
+    whitespace-free run longer than max_carry characters is cut unconditionally.
+    """
+    total_tokens = 0
+    carry = ""
+    for chunk in chunks:
+        buffer = carry + chunk if carry else chunk
+        split = find_safe_split(buffer)
+        if split <= 0:
+            if len(buffer) < max_carry:
+                carry = buffer
+                continue
+            split = len(buffer)
+        total_tokens += len(encoding.encode_ordinary(buffer[:split]))
+        carry = buffer[split:]
+    if carry:
+        total_tokens += len(encoding.encode_ordinary(carry))
+    return total_tokens
+
+def iter_file_bytes(file_path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[memoryview]:
+    """
+    Yields the raw bytes of a file in chunks of at most chunk_size bytes.
+
+    Regular files are memory-mapped and yielded as zero-copy memoryview slices,
+    which are released as soon as the consumer asks for the next chunk. Already
+    consumed pages are dropped from the mapping so resident memory stays around
+    one chunk even for multi-GB files. Pipes, character devices and anything
+    that cannot be mapped are read with plain buffered reads instead.
+    """
+    with open(file_path, "rb") as f:
+        mapped = None
+        try:
+            file_stat = os.fstat(f.fileno())
+            if stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            mapped = None
+
+        if mapped is None:
+            while chunk := f.read(chunk_size):
+                yield memoryview(chunk)
+            return
+
+        with mapped:
+            if hasattr(mapped, "madvise"):
+                mapped.madvise(mmap.MADV_SEQUENTIAL)
+            dropped = 0
+            with memoryview(mapped) as view:
+                for offset in range(0, len(mapped), chunk_size):
+                    with view[offset:offset + chunk_size] as chunk:
+                        yield chunk
+                    # Release the pages we are done with (offsets must be page aligned)
+                    consumed = min(offset + chunk_size, len(mapped)) // mmap.PAGESIZE * mmap.PAGESIZE
+                    if hasattr(mapped, "madvise") and consumed > dropped:
+                        mapped.madvise(mmap.MADV_DONTNEED, dropped, consumed - dropped)
+                        dropped = consumed
+
+def decode_chunks(
+    byte_chunks: Iterable[memoryview],
+    text_encoding: str = "utf-8",
+    progress: Optional["Progress"] = None,
+    task_id = None
+) -> Iterator[str]:
+    """
+    Incrementally decodes byte chunks to text, advancing the progress bar by bytes read.
+
+    Multibyte sequences split across chunk edges are held back by the decoder
+    until the rest of the sequence arrives.
+    """
+    decoder = codecs.getincrementaldecoder(text_encoding)()
+    for chunk in byte_chunks:
+        text = decoder.decode(chunk)
+        if progress and task_id is not None:
+            progress.update(task_id, advance=len(chunk))
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
 
 def count_tokens(
     file_path: Optional[str] = None,
     text_content: Optional[str] = None,
-    progress: Optional[Progress] = None,
+    progress: Optional["Progress"] = None,
     task_id = None,
     encoding_name: str = "cl100k_base",
-    chunk_size: int = 8192  # 8KB chunks
+    chunk_size: int = DEFAULT_CHUNK_SIZE
 ) -> int:
     """Counts the number of tokens in a file or string, updating a progress bar."""
     try:
-        encoding = tiktoken.get_encoding(encoding_name)
+        encoding = get_encoding(encoding_name)
         total_tokens = 0
 
         if text_content is not None:
-            total_tokens = len(encoding.encode(text_content))
-            if progress and task_id:
-                progress.update(task_id, total=len(text_content.encode('utf-8')), advance=len(text_content.encode('utf-8')))
+            total_tokens = len(encoding.encode_ordinary(text_content))
+            if progress and task_id is not None:
+                byte_length = len(text_content.encode('utf-8'))
+                progress.update(task_id, total=byte_length, advance=byte_length)
         elif file_path is not None:
             file_size = os.path.getsize(file_path)
-            if progress and task_id:
+            if progress and task_id is not None:
                 progress.update(task_id, total=file_size)
 
-            with open(file_path, "r") as f:
-                while chunk := f.read(chunk_size):
-                    total_tokens += len(encoding.encode(chunk))
-                    if progress and task_id:
-                        progress.update(task_id, advance=len(chunk.encode('utf-8')))
+            total_tokens = count_tokens_in_chunks(
+                decode_chunks(iter_file_bytes(file_path, chunk_size), progress=progress, task_id=task_id),
+                encoding,
+                max_carry=MAX_CARRY_FACTOR * chunk_size
+            )
         else:
             return -4 # No input provided
         
         return total_tokens
     except FileNotFoundError:
         return -1
+    except UnicodeDecodeError:
+        return -2 # Not valid UTF-8 text
     except ValueError:
         return -3 # Invalid encoding name
     except Exception as e:
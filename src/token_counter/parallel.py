@@ -0,0 +1,75 @@
+"""
+Parallel multi-file token counting backed by a worker pool.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, Executor, ThreadPoolExecutor, wait
+from typing import Iterator, List, Tuple
+
+from token_counter.counter import DEFAULT_CHUNK_SIZE, count_tokens, warm_up
+
+EXECUTOR_TYPES = ("process", "thread")
+
+# Number of tasks kept in flight per worker, so huge file lists don't turn into
+# one pending future per file.
+_TASKS_PER_WORKER = 4
+
+def resolve_jobs(jobs: int) -> int:
+    """Turns the --jobs value into a worker count (0 or less means one per CPU)."""
+    if jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+def _init_worker(encoding_name: str) -> None:
+    """Loads the encoding once when a worker starts so every file reuses it."""
+    try:
+        warm_up([encoding_name])
+    except Exception:
+        pass  # count_tokens reports the failure per file with its usual error code
+
+def _count_file(index: int, file_path: str, encoding_name: str, chunk_size: int) -> Tuple[int, str, int]:
+    """Worker entry point: counts one file and tags the result with its position."""
+    return index, file_path, count_tokens(file_path=file_path, encoding_name=encoding_name, chunk_size=chunk_size)
+
+def _make_executor(executor: str, workers: int, encoding_name: str) -> Executor:
+    if executor == "process":
+        # Imported here because it pulls in multiprocessing, which is slow to import
+        from concurrent.futures import ProcessPoolExecutor
+        return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(encoding_name,))
+    if executor == "thread":
+        # tiktoken releases the GIL while encoding, so threads share a single loaded encoding.
+        _init_worker(encoding_name)
+        return ThreadPoolExecutor(max_workers=workers)
+    raise ValueError(f"Unknown executor type: {executor}")
+
+def count_files_parallel(
+    file_paths: List[str],
+    encoding_name: str = "cl100k_base",
+    jobs: int = 0,
+    executor: str = "process",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Tuple[int, str, int]]:
+    """
+    Counts tokens in many files concurrently.
+
+    Yields (index, file_path, token_count) tuples in completion order, where index is
+    the file's position in file_paths so callers can restore the input order. Token
+    counts use the same error codes as count_tokens.
+    """
+    workers = min(resolve_jobs(jobs), len(file_paths)) or 1
+    max_in_flight = workers * _TASKS_PER_WORKER
+    pending_paths = iter(enumerate(file_paths))
+
+    with _make_executor(executor, workers, encoding_name) as pool:
+        in_flight = set()
+        for index, file_path in pending_paths:
+            in_flight.add(pool.submit(_count_file, index, file_path, encoding_name, chunk_size))
+            if len(in_flight) >= max_in_flight:
+                break
+        while in_flight:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+                next_item = next(pending_paths, None)
+                if next_item is not None:
+                    in_flight.add(pool.submit(_count_file, next_item[0], next_item[1], encoding_name, chunk_size))
@@ -0,0 +1,61 @@
+"""
+Shared fixtures for the test suite.
+
+The real tiktoken encodings are downloaded on first use, which is not possible
+in offline environments. The fixtures below seed tiktoken's registry with a
+small byte-level BPE that uses the genuine cl100k_base split pattern, so the
+code under test exercises the same pre-tokenizer behaviour without network
+access.
+"""
+
+import pytest
+import tiktoken
+import tiktoken.registry
+
+CL100K_PAT_STR = r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+| ?[^\s\p{L}\p{N}]++[\r\n]*+|\s++$|\s*[\r\n]|\s+(?!\S)|\s"""
+R50K_PAT_STR = r"""'(?:[sdmt]|ll|ve|re)| ?\p{L}++| ?\p{N}++| ?[^\s\p{L}\p{N}]++|\s++$|\s+(?!\S)|\s"""
+
+MERGE_WORDS = [
+    " the", " and", " of", " to", " in", " is", " that", " for", " token",
+    " count", " hello", " world", "the", "Hello", "ing", "tion", "  ", "    ",
+    "\n\n", " file", " text", "def", " return", "import",
+]
+
+OFFLINE_ENCODINGS = {
+    "cl100k_base": CL100K_PAT_STR,
+    "o200k_base": CL100K_PAT_STR,
+    "p50k_base": R50K_PAT_STR,
+    "r50k_base": R50K_PAT_STR,
+    "gpt2": R50K_PAT_STR,
+}
+
+
+def make_offline_encoding(name: str, pat_str: str = CL100K_PAT_STR) -> tiktoken.Encoding:
+    """Builds a small byte-level BPE encoding that needs no network access."""
+    ranks = {bytes([i]): i for i in range(256)}
+    for word in MERGE_WORDS:
+        data = word.encode("utf-8")
+        for end in range(2, len(data) + 1):
+            ranks.setdefault(data[:end], len(ranks))
+    return tiktoken.Encoding(
+        name=name,
+        pat_str=pat_str,
+        mergeable_ranks=ranks,
+        special_tokens={"<|endoftext|>": len(ranks)},
+    )
+
+
+@pytest.fixture(autouse=True, scope="session")
+def offline_encodings():
+    """Registers offline stand-ins for the encodings the CLI knows about."""
+    for name, pat_str in OFFLINE_ENCODINGS.items():
+        tiktoken.registry.ENCODINGS.setdefault(name, make_offline_encoding(name, pat_str))
+    yield
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keeps the persistent token count cache out of the user's home directory."""
+    cache_home = tmp_path / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home / "token-counter"
@@ -0,0 +1,74 @@
+"""
+Tests for the persistent token count cache.
+"""
+
+import os
+
+from typer.testing import CliRunner
+
+from token_counter.cache import TokenCountCache
+from token_counter.cli import app
+
+runner = CliRunner()
+
+
+def write_old_file(path, text):
+    """Writes a file with an mtime far enough in the past to be cacheable."""
+    path.write_text(text)
+    os.utime(path, (1_000_000_000, 1_000_000_000))
+    return str(path)
+
+
+def test_hit_after_put(tmp_path):
+    path = write_old_file(tmp_path / "a.txt", "hello world")
+    with TokenCountCache(tmp_path / "cache") as cache:
+        assert cache.get(path, "cl100k_base") is None
+        cache.put(path, "cl100k_base", 42)
+    with TokenCountCache(tmp_path / "cache") as cache:
+        assert cache.get(path, "cl100k_base") == 42
+        assert cache.get(path, "p50k_base") is None
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_changed_file_is_a_miss(tmp_path):
+    path = write_old_file(tmp_path / "a.txt", "hello world")
+    with TokenCountCache(tmp_path / "cache") as cache:
+        cache.get(path, "cl100k_base")
+        cache.put(path, "cl100k_base", 42)
+    write_old_file(tmp_path / "a.txt", "hello world, again")
+    with TokenCountCache(tmp_path / "cache") as cache:
+        assert cache.get(path, "cl100k_base") is None
+
+
+def test_recently_modified_and_failed_files_are_not_stored(tmp_path):
+    fresh = tmp_path / "fresh.txt"
+    fresh.write_text("hello")
+    old = write_old_file(tmp_path / "old.txt", "hello")
+    with TokenCountCache(tmp_path / "cache") as cache:
+        cache.put(str(fresh), "cl100k_base", 1)
+        cache.put(old, "cl100k_base", -2)
+    with TokenCountCache(tmp_path / "cache") as cache:
+        assert cache.get(str(fresh), "cl100k_base") is None
+        assert cache.get(old, "cl100k_base") is None
+
+
+def test_lru_eviction(tmp_path):
+    with TokenCountCache(tmp_path / "cache", max_size=64 * 1024) as cache:
+        for i in range(3000):
+            path = write_old_file(tmp_path / f"f{i}.txt", "x")
+            cache.put(path, "cl100k_base", i)
+            os.remove(path)
+    with TokenCountCache(tmp_path / "cache", max_size=64 * 1024) as cache:
+        assert cache.size() <= 64 * 1024
+
+
+def test_cli_reports_cache_statistics(tmp_path):
+    path = write_old_file(tmp_path / "a.txt", "hello world")
+    cache_dir = str(tmp_path / "cache")
+    cold = runner.invoke(app, [path, "--cache-dir", cache_dir])
+    warm = runner.invoke(app, [path, "--cache-dir", cache_dir])
+    assert "0 hits, 1 misses" in cold.output
+    assert "1 hits, 0 misses" in warm.output
+    uncached = runner.invoke(app, [path, "--no-cache"])
+    assert "Cache:" not in uncached.output
+    assert warm.output.split("Cache:")[0].split("Token Count Results")[1] == uncached.output.split("Token Count Results")[1]
@@ -2,4 +2,77 @@
 Tests for the CLI interface.
 """
 
-# TODO: Add tests for CLI functionality
\ No newline at end of file
+import os
+import subprocess
+import sys
+
+from typer.testing import CliRunner
+
+from token_counter.cli import app
+
+runner = CliRunner()
+
+
+def write_files(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"file_{i:02d}.txt"
+        path.write_text(f"hello world {i}\n" * (i + 1))
+        paths.append(str(path))
+    return paths
+
+
+def test_single_file(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("hello world")
+    result = runner.invoke(app, [str(path)])
+    assert result.exit_code == 0
+    assert "a.txt" in result.output
+
+
+def test_parallel_jobs_match_sequential(tmp_path):
+    paths = write_files(tmp_path, 6)
+    sequential = runner.invoke(app, paths)
+    for executor in ("thread", "process"):
+        parallel = runner.invoke(app, paths + ["--jobs", "3", "--executor", executor])
+        assert parallel.exit_code == 0
+        assert parallel.output.splitlines()[-10:] == sequential.output.splitlines()[-10:]
+
+
+def test_invalid_executor(tmp_path):
+    paths = write_files(tmp_path, 2)
+    result = runner.invoke(app, paths + ["--executor", "gpu"])
+    assert result.exit_code == 1
+    assert "Invalid executor" in result.output
+
+
+# Modules that must only be imported when actually needed, to keep startup fast.
+LAZY_MODULES = ("InquirerPy", "tiktoken", "multiprocessing")
+IMPORT_BUDGET_MS = float(os.environ.get("TOKEN_COUNTER_IMPORT_BUDGET_MS", "150"))
+
+
+def import_times(module):
+    """Runs `python -X importtime -c "import <module>"` and returns {module: cumulative_us}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cli_import_is_lazy():
+    imported = import_times("token_counter.cli")
+    for module in LAZY_MODULES:
+        assert module not in imported, f"{module} is imported eagerly by token_counter.cli"
+
+
+def test_cli_import_time_budget():
+    best_ms = min(import_times("token_counter.cli")["token_counter.cli"] for _ in range(3)) / 1000
+    assert best_ms < IMPORT_BUDGET_MS, f"importing token_counter.cli took {best_ms:.1f}ms"
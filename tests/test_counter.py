@@ -2,4 +2,121 @@
 Tests for the core token counting functionality.
 """
 
-# TODO: Add tests for counter.py functions
\ No newline at end of file
+import os
+
+import pytest
+import tiktoken
+
+from token_counter.counter import (
+    DEFAULT_CHUNK_SIZE,
+    count_tokens,
+    count_tokens_in_chunks,
+    decode_chunks,
+    find_safe_split,
+    get_encoding,
+    iter_file_bytes,
+    warm_up,
+)
+from token_counter.parallel import count_files_parallel
+
+
+def test_count_text():
+    encoding = tiktoken.get_encoding("cl100k_base")
+    text = "hello world, the token count"
+    assert count_tokens(text_content=text) == len(encoding.encode(text))
+
+
+def test_error_codes(tmp_path):
+    assert count_tokens(file_path=str(tmp_path / "missing.txt")) == -1
+    assert count_tokens(text_content="hi", encoding_name="no_such_encoding") == -3
+    assert count_tokens() == -4
+
+
+def test_count_files_parallel_preserves_error_codes(tmp_path):
+    good = tmp_path / "good.txt"
+    good.write_text("hello world")
+    paths = [str(good), str(tmp_path / "missing.txt")]
+    results = sorted(count_files_parallel(paths, "cl100k_base", jobs=2, executor="thread"))
+    assert results == [(0, paths[0], count_tokens(file_path=paths[0])), (1, paths[1], -1)]
+    invalid = list(count_files_parallel(paths[:1], "no_such_encoding", jobs=2, executor="process"))
+    assert invalid == [(0, paths[0], -3)]
+
+
+STREAMING_SAMPLES = {
+    "prose": "The quick brown fox jumps over the lazy dog. It's the token count that matters!\n" * 40,
+    "code": "def f(x):\n    return x  # comment\n\n\n\tif x:\n        pass\r\n" * 30,
+    "unicode": "héllo wörld — 你好，世界 🙂🙂 naïve café\u00a0\u2003end\n" * 30,
+    "whitespace": "word" + " " * 300 + "\n\n\n   \t\t" + "x " * 200 + "   \n",
+    "no_whitespace": "abc,def;" * 400,
+    "numbers": "1234567 89 0.5e10 " * 100,
+}
+
+
+@pytest.mark.parametrize("encoding_name", ["cl100k_base", "r50k_base"])
+@pytest.mark.parametrize("sample", sorted(STREAMING_SAMPLES))
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1000])
+def test_streaming_matches_whole_text(encoding_name, sample, chunk_size):
+    encoding = tiktoken.get_encoding(encoding_name)
+    text = STREAMING_SAMPLES[sample]
+    chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    expected = len(encoding.encode(text))
+    assert count_tokens_in_chunks(chunks, encoding, max_carry=len(text) + 1) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [512, 4096, DEFAULT_CHUNK_SIZE])
+def test_count_tokens_file_matches_whole_text(tmp_path, chunk_size):
+    text = "".join(STREAMING_SAMPLES.values())
+    path = tmp_path / "sample.txt"
+    path.write_text(text, encoding="utf-8", newline="")
+    encoding = tiktoken.get_encoding("cl100k_base")
+    assert count_tokens(file_path=str(path), chunk_size=chunk_size) == len(encoding.encode(text))
+
+
+def test_find_safe_split():
+    assert find_safe_split("hello world") == 5
+    assert find_safe_split("hello   ") == 5
+    assert find_safe_split("   hello") == -1
+    assert find_safe_split("") == -1
+
+
+def test_special_token_text_is_counted_as_ordinary_text():
+    assert count_tokens(text_content="a <|endoftext|> b") > 3
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 4096])
+def test_multibyte_sequences_split_across_chunks(tmp_path, chunk_size):
+    text = "naïve 你好 🙂 café\n" * 200
+    path = tmp_path / "unicode.txt"
+    path.write_bytes(text.encode("utf-8"))
+    decoded = "".join(decode_chunks(iter_file_bytes(str(path), chunk_size)))
+    assert decoded == text
+
+
+def test_iter_file_bytes_handles_empty_and_non_regular_files(tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+    assert list(iter_file_bytes(str(empty))) == []
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, "héllo wörld".encode("utf-8"))
+    os.close(write_fd)
+    try:
+        assert "".join(decode_chunks(iter_file_bytes(f"/dev/fd/{read_fd}", 2))) == "héllo wörld"
+    finally:
+        os.close(read_fd)
+
+
+def test_crlf_and_invalid_utf8(tmp_path):
+    crlf = tmp_path / "crlf.txt"
+    crlf.write_bytes(b"hello\r\nworld\r\n")
+    encoding = tiktoken.get_encoding("cl100k_base")
+    assert count_tokens(file_path=str(crlf)) == len(encoding.encode("hello\r\nworld\r\n"))
+    invalid = tmp_path / "invalid.txt"
+    invalid.write_bytes(b"hello \xff\xfe world")
+    assert count_tokens(file_path=str(invalid)) == -2
+
+
+def test_encoding_registry():
+    assert get_encoding("cl100k_base") is get_encoding("cl100k_base")
+    warm_up(["cl100k_base", "p50k_base"])
+    with pytest.raises(ValueError):
+        get_encoding("no_such_encoding")